@@ -11,16 +11,27 @@ Tools available:
 """
 
 import sys
-import json
 import os
+import signal
+import re
 import asyncio
 import logging
+import functools
+import codecs
+import time
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Union
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from selectolax.lexbor import LexborHTMLParser
 import aiohttp
-from urllib.parse import urljoin, urlparse, quote
+import orjson
+from cachetools import TTLCache
+from urllib.parse import urljoin, urlparse, quote, parse_qs
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +41,109 @@ logging.basicConfig(
 )
 logger = logging.getLogger('web-search-mcp')
 
+# Only advertise brotli when aiohttp can actually decode it
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+# Tool descriptions are static; a read-only mapping shared by every lookup
+_TOOL_DESCRIPTIONS = MappingProxyType({
+    'webSearch': 'Search the web using DuckDuckGo (no API key required)',
+    'fetchWebpage': 'Fetch and parse webpage content',
+    'extractLinks': 'Extract all links from a webpage',
+    'scrapeData': 'Scrape structured data from a webpage using CSS selectors'
+})
+
+_WS_RE = re.compile(r'\s+')
+
+# Elements that contribute no readable text to a page
+_DROP_TAGS = frozenset({'script', 'style', 'noscript', 'svg', 'template', 'iframe'})
+
+# Compiled XPath queries for fetch_webpage; each runs as a single C-level traversal
+_TEXT_XP = etree.XPath('//text()', smart_strings=False)
+# An element's own text, leaving out script and style source as bs4's get_text() did
+_ELEMENT_TEXT_XP = etree.XPath('.//text()[not(ancestor::script or ancestor::style)]',
+                               smart_strings=False)
+_METADATA_XP = etree.XPath('//title | //meta[@name or @property] | //h1 | //h2')
+
+# Search results only live in div.result; skip building nodes for the rest of the page.
+# The strainer sees the raw class attribute, so match 'result' as a whitespace token.
+_RESULT_STRAINER = SoupStrainer('div', class_=re.compile(r'(?:^|\s)result(?:\s|$)'))
+
+# Content types worth parsing; anything else is returned without text or metadata
+_HTML_TYPES = ('text/html', 'application/xhtml')
+
+# Whitespace-separated attributes that scrapeData returns as token lists, matching
+# BeautifulSoup's multi-valued attribute table ('*' applies to every tag)
+_LIST_ATTRIBUTES = {
+    '*': frozenset({'class', 'accesskey', 'dropzone'}),
+    'a': frozenset({'rel', 'rev'}),
+    'link': frozenset({'rel', 'rev'}),
+    'td': frozenset({'headers'}),
+    'th': frozenset({'headers'}),
+    'form': frozenset({'accept-charset'}),
+    'object': frozenset({'archive'}),
+    'area': frozenset({'rel'}),
+    'icon': frozenset({'sizes'}),
+    'iframe': frozenset({'sandbox'}),
+    'output': frozenset({'for'})
+}
+
+# Parse from UTF-8 bytes so pages carrying an XML encoding declaration still load.
+# huge_tree lifts libxml2's ~256-level nesting limit, past which it silently drops the
+# rest of the document; bodies are already capped at max_response_bytes.
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8', huge_tree=True)
+
+
+def _parse_html(html: str):
+    """Parse markup into an lxml tree, tolerating empty documents"""
+    try:
+        return lxml.html.document_fromstring(html.encode('utf-8'), parser=_HTML_PARSER)
+    except etree.ParserError:
+        # Blank bodies, or ones holding only a doctype or comments, have no elements
+        return lxml.html.document_fromstring(b'<html></html>', parser=_HTML_PARSER)
+
+
+def _element_text(element) -> str:
+    """Get an element's text with whitespace runs collapsed to single spaces"""
+    if element.tag in ('script', 'style'):
+        # Selected directly (e.g. JSON-LD blocks), the source is the text
+        return _WS_RE.sub(' ', element.text_content()).strip()
+    return _WS_RE.sub(' ', ''.join(_ELEMENT_TEXT_XP(element))).strip()
+
+
+def _attribute_value(element, attribute: str):
+    """Read an attribute, splitting multi-valued ones into a list of tokens"""
+    value = element.get(attribute)
+    if value is not None and (attribute in _LIST_ATTRIBUTES['*']
+                              or attribute in _LIST_ATTRIBUTES.get(element.tag, ())):
+        return value.split()
+    return value
+
+
+def _is_html(content_type: str) -> bool:
+    """Check whether a Content-Type header names an HTML document"""
+    mime = content_type.split(';', 1)[0].strip().lower()
+    return not mime or mime.startswith(_HTML_TYPES)
+
+
+def _enrich_limit(value) -> Optional[int]:
+    """Clamp an enrichTop parameter to 0-20; None when it isn't an integer"""
+    if value is None:
+        return 0
+    try:
+        return max(0, min(int(value), 20))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_selector(selector: str) -> CSSSelector:
+    """Compile a CSS selector once; repeat scrapes reuse the translated XPath"""
+    return CSSSelector(selector, translator='html')
+
 
 class WebSearchMCP:
     """MCP Server for web search and scraping operations"""
@@ -37,20 +151,39 @@ class WebSearchMCP:
     def __init__(self):
         self.server_name = os.environ.get('MCP_NAME', 'web-search-mcp')
         self.tools = {}
+        self._tools_list = []
         self.session = None
-        self.cache = {}  # Simple in-memory cache
+        self._fetch_sem = None
+        self._handler_sem = None
+        self._pending = set()  # In-flight handle_message tasks
         self.cache_ttl = 300  # 5 minutes
+        self.max_response_bytes = 2_000_000  # Bodies are truncated past this size
+        self.cache = TTLCache(maxsize=1024, ttl=self.cache_ttl, timer=time.monotonic)
 
     async def initialize(self):
         """Initialize the MCP server"""
         logger.info(f"Initializing {self.server_name}")
 
-        # Create aiohttp session
+        # Create aiohttp session with a pooled connector so repeat fetches
+        # reuse keep-alive connections and cached DNS lookups
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=10,
+            enable_cleanup_closed=True,
+            ttl_dns_cache=300
+        )
         self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=10, connect=5, sock_read=10),
             headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; MCP-Bot/1.0)'
+                'User-Agent': 'Mozilla/5.0 (compatible; MCP-Bot/1.0)',
+                'Accept-Encoding': _ACCEPT_ENCODING,
+                'Accept': 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.8'
             }
         )
+        # Cap concurrent outbound requests so bursts of tool calls queue
+        # instead of exhausting sockets
+        self._fetch_sem = asyncio.BoundedSemaphore(20)
 
         # Register tools
         self.register_tool('webSearch', self.web_search)
@@ -58,19 +191,22 @@ class WebSearchMCP:
         self.register_tool('extractLinks', self.extract_links)
         self.register_tool('scrapeData', self.scrape_data)
 
+        # The tool set is fixed after registration, so build the listing once
+        self._tools_list = [
+            {
+                'name': name,
+                'description': self.get_tool_description(name)
+            }
+            for name in self.tools.keys()
+        ]
+
         # Send initialization response
         self.send_response({
             'type': 'initialize',
             'status': 'success',
             'serverName': self.server_name,
             'version': '1.0.0',
-            'tools': [
-                {
-                    'name': name,
-                    'description': self.get_tool_description(name)
-                }
-                for name in self.tools.keys()
-            ]
+            'tools': self._tools_list
         })
 
         logger.info(f"Server initialized with {len(self.tools)} tools")
@@ -82,17 +218,14 @@ class WebSearchMCP:
 
     def get_tool_description(self, tool_name: str) -> str:
         """Get description for a tool"""
-        descriptions = {
-            'webSearch': 'Search the web using DuckDuckGo (no API key required)',
-            'fetchWebpage': 'Fetch and parse webpage content',
-            'extractLinks': 'Extract all links from a webpage',
-            'scrapeData': 'Scrape structured data from a webpage using CSS selectors'
-        }
-        return descriptions.get(tool_name, 'No description available')
+        return _TOOL_DESCRIPTIONS.get(tool_name, 'No description available')
 
     def send_response(self, response: Dict[str, Any]):
         """Send response to stdout"""
-        print(json.dumps(response), flush=True)
+        stdout = sys.stdout.buffer
+        stdout.write(orjson.dumps(response))
+        stdout.write(b'\n')
+        stdout.flush()
 
     def send_error(self, error: Exception, request_id: Optional[str] = None):
         """Send error response"""
@@ -106,12 +239,63 @@ class WebSearchMCP:
             }
         })
 
-    async def web_search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _cache_result(self, cache_key: tuple, result: Dict[str, Any]) -> orjson.Fragment:
+        """
+        Cache a successful tool result in serialized form. The returned
+        fragment is spliced verbatim into the tool response, so cache hits
+        are never re-encoded.
+        """
+        encoded = orjson.Fragment(orjson.dumps(result))
+        self.cache[cache_key] = encoded
+        return encoded
+
+    async def _read_body(self, response: aiohttp.ClientResponse) -> str:
+        """Stream a response body, stopping once max_response_bytes is reached"""
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.max_response_bytes:
+                break
+        body = b''.join(chunks)[:self.max_response_bytes]
+
+        encoding = response.charset or 'utf-8'
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = 'utf-8'
+        return body.decode(encoding, errors='replace')
+
+    async def _fetch_head(self, url: str) -> Dict[str, Any]:
+        """Check a URL with a HEAD request, without downloading its body"""
+        try:
+            async with self._fetch_sem:
+                async with self.session.head(url, allow_redirects=True) as response:
+                    return {
+                        'statusCode': response.status,
+                        'contentType': response.headers.get('Content-Type', ''),
+                        'finalUrl': str(response.url)
+                    }
+        except asyncio.TimeoutError:
+            return {'error': 'Request timeout'}
+        except Exception as e:
+            return {'error': str(e)}
+
+    async def _enrich(self, entries: List[Dict[str, Any]], limit: int):
+        """HEAD-check the first `limit` http(s) URLs in parallel, annotating entries in place"""
+        targets = [entry for entry in entries if entry['url'].startswith(('http://', 'https://'))][:limit]
+        heads = await asyncio.gather(*[self._fetch_head(entry['url']) for entry in targets])
+        for entry, head in zip(targets, heads):
+            entry['head'] = head
+
+    async def web_search(self, params: Dict[str, Any]) -> Union[Dict[str, Any], orjson.Fragment]:
         """
         Search the web using DuckDuckGo HTML version (no API key required)
         """
         query = params.get('query', '')
         max_results = min(params.get('maxResults', 10), 20)
+        enrich_top = _enrich_limit(params.get('enrichTop'))
 
         if not query:
             return {
@@ -119,6 +303,17 @@ class WebSearchMCP:
                 'error': 'Query parameter is required'
             }
 
+        if enrich_top is None:
+            return {
+                'success': False,
+                'error': 'enrichTop must be an integer'
+            }
+
+        cache_key = ('search', query, max_results, enrich_top)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Use DuckDuckGo HTML search (no API key required)
             search_url = 'https://html.duckduckgo.com/html/'
@@ -130,10 +325,11 @@ class WebSearchMCP:
                 'o': 'json'
             }
 
-            async with self.session.post(search_url, data=search_params) as response:
-                html = await response.text()
+            async with self._fetch_sem:
+                async with self.session.post(search_url, data=search_params) as response:
+                    html = await self._read_body(response)
 
-            soup = BeautifulSoup(html, 'lxml')
+            soup = BeautifulSoup(html, 'lxml', parse_only=_RESULT_STRAINER)
             results = []
 
             # Parse search results
@@ -147,10 +343,10 @@ class WebSearchMCP:
 
                     # DuckDuckGo URLs are redirects, extract actual URL
                     if url.startswith('//duckduckgo.com/l/'):
-                        url_params = urlparse(url).query
-                        if 'uddg=' in url_params:
-                            import urllib.parse
-                            url = urllib.parse.unquote(url_params.split('uddg=')[1].split('&')[0])
+                        # parse_qs already percent-decodes the values
+                        uddg = parse_qs(urlparse(url).query).get('uddg')
+                        if uddg:
+                            url = uddg[0]
 
                     snippet = snippet_elem.get_text(strip=True) if snippet_elem else ''
 
@@ -161,12 +357,16 @@ class WebSearchMCP:
                         'source': 'DuckDuckGo'
                     })
 
-            return {
+            if enrich_top:
+                await self._enrich(results, enrich_top)
+
+            result = {
                 'success': True,
                 'query': query,
                 'results': results,
                 'count': len(results)
             }
+            return self._cache_result(cache_key, result)
 
         except Exception as e:
             logger.error(f"Search failed: {e}")
@@ -175,7 +375,7 @@ class WebSearchMCP:
                 'error': str(e)
             }
 
-    async def fetch_webpage(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def fetch_webpage(self, params: Dict[str, Any]) -> Union[Dict[str, Any], orjson.Fragment]:
         """
         Fetch and parse webpage content
         """
@@ -190,18 +390,17 @@ class WebSearchMCP:
             }
 
         # Check cache
-        cache_key = f"fetch:{url}"
-        if cache_key in self.cache:
-            cached_time, cached_data = self.cache[cache_key]
-            if (datetime.now() - cached_time).seconds < self.cache_ttl:
-                return cached_data
+        cache_key = ('fetch', url, extract_text, extract_metadata)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            async with self.session.get(url, timeout=10) as response:
-                html = await response.text()
-                content_type = response.headers.get('Content-Type', '')
-
-            soup = BeautifulSoup(html, 'lxml')
+            async with self._fetch_sem:
+                async with self.session.get(url) as response:
+                    content_type = response.headers.get('Content-Type', '')
+                    is_html = _is_html(content_type)
+                    html = await self._read_body(response) if is_html else ''
 
             result = {
                 'success': True,
@@ -210,48 +409,56 @@ class WebSearchMCP:
                 'contentType': content_type
             }
 
-            if extract_text:
-                # Remove script and style elements
-                for script in soup(['script', 'style']):
-                    script.decompose()
-
-                # Extract text
-                text = soup.get_text()
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                text = ' '.join(chunk for chunk in chunks if chunk)
+            # Non-HTML bodies (images, PDFs, JSON, ...) are not parsed for text or metadata
+            if not is_html:
+                return self._cache_result(cache_key, result)
 
-                result['text'] = text[:10000]  # Limit text length
-                result['textLength'] = len(text)
+            tree = _parse_html(html)
 
+            # Read metadata before text extraction strips elements, so meta tags in
+            # <noscript> or titles in <svg> don't depend on extractText
+            metadata = None
             if extract_metadata:
                 metadata = {}
-
-                # Extract title
-                title = soup.find('title')
-                if title:
-                    metadata['title'] = title.get_text(strip=True)
-
-                # Extract meta tags
-                for meta in soup.find_all('meta'):
-                    name = meta.get('name') or meta.get('property')
-                    content = meta.get('content')
-                    if name and content:
-                        metadata[name] = content
-
-                # Extract headings
-                headings = {
-                    'h1': [h.get_text(strip=True) for h in soup.find_all('h1', limit=5)],
-                    'h2': [h.get_text(strip=True) for h in soup.find_all('h2', limit=5)]
-                }
+                title = None
+                meta_tags = {}
+                headings = {'h1': [], 'h2': []}
+
+                # Title, meta tags and headings come back from one traversal in
+                # document order; split them up by tag
+                for element in _METADATA_XP(tree):
+                    if element.tag == 'meta':
+                        name = element.get('name') or element.get('property')
+                        content = element.get('content')
+                        if name and content:
+                            meta_tags[name] = content
+                    elif element.tag == 'title':
+                        if title is None:
+                            title = _element_text(element)
+                    elif len(headings[element.tag]) < 5:
+                        headings[element.tag].append(_element_text(element))
+
+                # Meta tags take precedence over <title> for a 'title' key
+                if title is not None:
+                    metadata['title'] = title
+                metadata.update(meta_tags)
                 metadata['headings'] = headings
 
+            if extract_text:
+                # Remove elements that carry no readable text
+                etree.strip_elements(tree, *_DROP_TAGS, with_tail=False)
+
+                # Extract text, collapsing whitespace runs in one regex pass
+                text = _WS_RE.sub(' ', ' '.join(_TEXT_XP(tree))).strip()
+
+                result['text'] = text[:10000]  # Limit text length
+                result['textLength'] = len(text)
+
+            if metadata is not None:
                 result['metadata'] = metadata
 
             # Cache the result
-            self.cache[cache_key] = (datetime.now(), result)
-
-            return result
+            return self._cache_result(cache_key, result)
 
         except asyncio.TimeoutError:
             return {
@@ -265,13 +472,14 @@ class WebSearchMCP:
                 'error': str(e)
             }
 
-    async def extract_links(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def extract_links(self, params: Dict[str, Any]) -> Union[Dict[str, Any], orjson.Fragment]:
         """
         Extract all links from a webpage
         """
         url = params.get('url', '')
         internal_only = params.get('internalOnly', False)
         external_only = params.get('externalOnly', False)
+        enrich_top = _enrich_limit(params.get('enrichTop'))
 
         if not url:
             return {
@@ -279,18 +487,33 @@ class WebSearchMCP:
                 'error': 'URL parameter is required'
             }
 
-        try:
-            async with self.session.get(url, timeout=10) as response:
-                html = await response.text()
-                base_url = str(response.url)
+        if enrich_top is None:
+            return {
+                'success': False,
+                'error': 'enrichTop must be an integer'
+            }
 
-            soup = BeautifulSoup(html, 'lxml')
+        cache_key = ('links', url, internal_only, external_only, enrich_top)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            async with self._fetch_sem:
+                async with self.session.get(url) as response:
+                    # Non-HTML bodies have no links; skip downloading them
+                    content_type = response.headers.get('Content-Type', '')
+                    html = await self._read_body(response) if _is_html(content_type) else ''
+                    base_url = str(response.url)
+
+            tree = LexborHTMLParser(html)
             parsed_base = urlparse(base_url)
             links = []
             seen = set()
+            internal_count = 0
 
-            for link in soup.find_all('a', href=True):
-                href = link['href']
+            for link in tree.css('a[href]'):
+                href = link.attributes.get('href') or ''
                 absolute_url = urljoin(base_url, href)
                 parsed_url = urlparse(absolute_url)
 
@@ -306,21 +529,27 @@ class WebSearchMCP:
                 if external_only and is_internal:
                     continue
 
+                if is_internal:
+                    internal_count += 1
                 links.append({
                     'url': absolute_url,
-                    'text': link.get_text(strip=True)[:100],
+                    'text': link.text(strip=True)[:100],
                     'internal': is_internal,
                     'protocol': parsed_url.scheme
                 })
 
-            return {
+            if enrich_top:
+                await self._enrich(links, enrich_top)
+
+            result = {
                 'success': True,
                 'url': base_url,
                 'links': links,
                 'count': len(links),
-                'internal': sum(1 for l in links if l['internal']),
-                'external': sum(1 for l in links if not l['internal'])
+                'internal': internal_count,
+                'external': len(links) - internal_count
             }
+            return self._cache_result(cache_key, result)
 
         except Exception as e:
             logger.error(f"Link extraction failed: {e}")
@@ -329,7 +558,7 @@ class WebSearchMCP:
                 'error': str(e)
             }
 
-    async def scrape_data(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def scrape_data(self, params: Dict[str, Any]) -> Union[Dict[str, Any], orjson.Fragment]:
         """
         Scrape structured data from a webpage using CSS selectors
         """
@@ -348,41 +577,52 @@ class WebSearchMCP:
                 'error': 'Selectors parameter is required'
             }
 
+        # Selector configs are nested dicts, so key on their canonical JSON form
+        cache_key = ('scrape', url, orjson.dumps(selectors, option=orjson.OPT_SORT_KEYS))
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            async with self.session.get(url, timeout=10) as response:
-                html = await response.text()
+            async with self._fetch_sem:
+                async with self.session.get(url) as response:
+                    # Non-HTML bodies have nothing to select; skip downloading them
+                    content_type = response.headers.get('Content-Type', '')
+                    html = await self._read_body(response) if _is_html(content_type) else ''
 
-            soup = BeautifulSoup(html, 'lxml')
+            tree = _parse_html(html)
             scraped_data = {}
 
             for key, selector_config in selectors.items():
                 if isinstance(selector_config, str):
                     # Simple selector
-                    elements = soup.select(selector_config)
+                    elements = _compile_selector(selector_config)(tree)
                     if elements:
-                        scraped_data[key] = [elem.get_text(strip=True) for elem in elements]
+                        scraped_data[key] = [_element_text(elem) for elem in elements]
                 elif isinstance(selector_config, dict):
                     # Complex selector with options
                     selector = selector_config.get('selector', '')
                     attribute = selector_config.get('attribute')
                     single = selector_config.get('single', False)
 
-                    elements = soup.select(selector)
+                    elements = _compile_selector(selector)(tree)
 
                     if elements:
                         if attribute:
-                            values = [elem.get(attribute) for elem in elements if elem.get(attribute)]
+                            values = [_attribute_value(elem, attribute) for elem in elements]
+                            values = [value for value in values if value]
                         else:
-                            values = [elem.get_text(strip=True) for elem in elements]
+                            values = [_element_text(elem) for elem in elements]
 
                         scraped_data[key] = values[0] if single and values else values
 
-            return {
+            result = {
                 'success': True,
                 'url': url,
                 'data': scraped_data,
                 'fieldsExtracted': len(scraped_data)
             }
+            return self._cache_result(cache_key, result)
 
         except Exception as e:
             logger.error(f"Scraping failed: {e}")
@@ -394,7 +634,7 @@ class WebSearchMCP:
     async def handle_message(self, message: str):
         """Handle incoming message"""
         try:
-            request = json.loads(message)
+            request = orjson.loads(message)
             logger.debug(f"Received request: {request.get('type')} - {request.get('tool')}")
 
             if request['type'] == 'tool' and request.get('tool'):
@@ -420,13 +660,7 @@ class WebSearchMCP:
                 self.send_response({
                     'type': 'tools_list',
                     'requestId': request.get('id'),
-                    'tools': [
-                        {
-                            'name': name,
-                            'description': self.get_tool_description(name)
-                        }
-                        for name in self.tools.keys()
-                    ]
+                    'tools': self._tools_list
                 })
 
             elif request['type'] == 'ping':
@@ -442,7 +676,7 @@ class WebSearchMCP:
                     request.get('id')
                 )
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON: {e}")
             self.send_error(e)
         except Exception as e:
@@ -461,6 +695,10 @@ class WebSearchMCP:
 
         logger.info(f"{self.server_name} is running")
 
+        # Dispatch each message as its own task so a slow tool call doesn't
+        # hold up reading the next line; the semaphore caps handlers in flight
+        self._handler_sem = asyncio.BoundedSemaphore(32)
+
         try:
             while True:
                 line = await reader.readline()
@@ -469,13 +707,25 @@ class WebSearchMCP:
 
                 message = line.decode('utf-8').strip()
                 if message:
-                    await self.handle_message(message)
+                    await self._handler_sem.acquire()
+                    task = asyncio.create_task(self.handle_message(message))
+                    self._pending.add(task)
+                    task.add_done_callback(self._handler_done)
+
+            # Let in-flight requests answer before shutting down on EOF
+            if self._pending:
+                await asyncio.gather(*self._pending)
 
         except KeyboardInterrupt:
             logger.info("Received interrupt signal")
         finally:
             await self.shutdown()
 
+    def _handler_done(self, task: asyncio.Task):
+        """Release the dispatch slot held by a finished handler task"""
+        self._pending.discard(task)
+        self._handler_sem.release()
+
     async def shutdown(self):
         """Shutdown the server"""
         logger.info("Shutting down server")
@@ -489,8 +739,6 @@ def main():
     server = WebSearchMCP()
 
     # Handle signals
-    import signal
-
     def signal_handler(sig, frame):
         logger.info(f"Received signal {sig}")
         asyncio.create_task(server.shutdown())
@@ -498,9 +746,15 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    # Run the server
+    # Run the server, on the libuv-based event loop when uvloop is installed
+    try:
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+
     try:
-        asyncio.run(server.run())
+        run(server.run())
     except KeyboardInterrupt:
         pass
 